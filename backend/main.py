@@ -1,6 +1,12 @@
-from fastapi import FastAPI, File, UploadFile
-import json, yaml
-from nlp.nlp_utils import search_endpoint  # import your NLP function
+from fastapi import FastAPI, File, HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
+import hashlib, itertools, orjson, yaml
+from nlp.nlp_utils import build_search_index, search_endpoint  # import your NLP function
+
+try:
+    from yaml import CSafeLoader as SafeLoader  # libyaml-backed parser
+except ImportError:
+    from yaml import SafeLoader
 
 app = FastAPI(
     title="Smart API Documentation Assistant",
@@ -10,24 +16,83 @@ app = FastAPI(
 
 # Store the uploaded spec globally for simplicity
 API_SPEC = {}
+# Flattened endpoints of API_SPEC, rebuilt on every upload
+SEARCH_INDEX = build_search_index({})
+
+# Parsed uploads keyed by content hash, so re-posting the same file skips
+# parsing and indexing. Least recently uploaded entries are dropped first.
+# Each entry keeps a whole parsed spec plus its search index alive, so the
+# bound stays small.
+_SPEC_CACHE = {}
+_SPEC_CACHE_SIZE = 4
+
+# Uploads parse off the event loop and may finish out of order; each one
+# takes a sequence number and only publishes if nothing newer already has
+_UPLOAD_SEQ = itertools.count(1)
+_PUBLISHED_SEQ = 0
+
+def _load_spec(content: bytes):
+    """
+    Parse an uploaded spec and build its search index and metadata
+    """
+    try:
+        spec = orjson.loads(content)
+    except orjson.JSONDecodeError:
+        try:
+            spec = yaml.load(content, Loader=SafeLoader)
+        except yaml.YAMLError:
+            spec = None
+    if not isinstance(spec, dict):
+        raise HTTPException(status_code=400, detail="Spec must be a valid JSON or YAML object")
+    index = build_search_index(spec)
+    info = spec.get("info")
+    if not isinstance(info, dict):
+        info = {}
+    paths = spec.get("paths")
+    meta = {
+        "title": info.get("title") or "undefined",
+        "version": info.get("version") or "undefined",
+        "path_count": len(paths) if isinstance(paths, dict) else 0
+    }
+    return spec, index, meta
 
 @app.post("/parse-spec")
-async def parse_api_spec(file: UploadFile = File(...)):
+async def parse_api_spec(file: UploadFile = File(...)) -> dict:
     content = await file.read()
-    global API_SPEC
-    try:
-        API_SPEC = json.loads(content)
-    except json.JSONDecodeError:
-        API_SPEC = yaml.safe_load(content)
+    global API_SPEC, SEARCH_INDEX, _PUBLISHED_SEQ
+    seq = next(_UPLOAD_SEQ)
+    key = hashlib.blake2b(content, digest_size=16).digest()
+    loaded = _SPEC_CACHE.pop(key, None)
+    if loaded is not None:
+        # Re-insert so a hit moves the entry to the most recent end
+        _SPEC_CACHE[key] = loaded
+    else:
+        # Parsing a large spec (YAML especially) would block the event loop
+        loaded = await run_in_threadpool(_load_spec, content)
+        # A concurrent upload of the same file may have cached it meanwhile;
+        # replacing that entry must not evict an unrelated one
+        if _SPEC_CACHE.pop(key, None) is None and len(_SPEC_CACHE) >= _SPEC_CACHE_SIZE:
+            del _SPEC_CACHE[next(iter(_SPEC_CACHE))]
+        _SPEC_CACHE[key] = loaded
+    spec, index, meta = loaded
+    published = seq > _PUBLISHED_SEQ
+    if published:
+        _PUBLISHED_SEQ = seq
+        # Publish in one statement so readers never pair the new spec with
+        # the old index or vice versa
+        API_SPEC, SEARCH_INDEX = spec, index
+        message = "Spec uploaded successfully!"
+    else:
+        message = "Spec parsed, but a newer upload is already active"
 
-    return {"message": "Spec uploaded successfully!"}
+    return {"message": message, "published": published, **meta}
 
 @app.get("/search")
-def search(query: str):
+async def search(query: str) -> dict:
     """
     Search API endpoints using NLP
     """
     if not API_SPEC:
         return {"error": "No API spec uploaded yet"}
-    results = search_endpoint(API_SPEC, query)
+    results = search_endpoint(SEARCH_INDEX, query)
     return {"results": results}
\ No newline at end of file
@@ -1,18 +1,78 @@
 # nlp/nlp_utils.py
-import json
+from bisect import bisect_right
 
-def search_endpoint(spec: dict, query: str):
+# Operation keys allowed in an OpenAPI path item, mapped to the shared
+# upper-case name reported in search results
+HTTP_METHODS = {
+    m: m.upper()
+    for m in ("get", "put", "post", "delete", "options", "head", "patch", "trace")
+}
+
+def build_search_index(spec: dict):
     """
-    Simple keyword search in API spec
+    Flatten the API spec into searchable entries once, at upload time.
+    The lowercased path and summary of every endpoint are joined into one
+    NUL-separated blob; starts[i] is where endpoint i begins in it and
+    results[i] is what a match on it returns.
     """
+    chunks = []
+    starts = []
     results = []
-    paths = spec.get("paths", {})
+    add_chunk = chunks.append
+    add_start = starts.append
+    add_result = results.append
+    offset = 0
+    paths = spec.get("paths")
+    if not isinstance(paths, dict):
+        paths = {}
     for path, methods in paths.items():
+        if not isinstance(path, str) or not isinstance(methods, dict):
+            continue
+        path_lower = path.lower()
         for method, details in methods.items():
-            if query.lower() in path.lower() or query.lower() in details.get("summary", "").lower():
-                results.append({
-                    "path": path,
-                    "method": method.upper(),
-                    "summary": details.get("summary", "")
-                })
-    return results
\ No newline at end of file
+            # Path items also hold "parameters", "servers", "$ref" and x-
+            # extensions next to their operations; index only HTTP verbs
+            if not isinstance(method, str) or not isinstance(details, dict):
+                continue
+            method_name = HTTP_METHODS.get(method.lower())
+            if method_name is None:
+                continue
+            summary = details.get("summary", "")
+            if not isinstance(summary, str):
+                summary = ""
+            # NUL keeps a query from matching across the path/summary boundary
+            chunk = path_lower + "\0" + summary.lower()
+            add_chunk(chunk)
+            add_start(offset)
+            offset += len(chunk) + 1
+            add_result({
+                "path": path,
+                "method": method_name,
+                "summary": summary
+            })
+    return {"blob": "\0".join(chunks), "starts": starts, "results": results}
+
+def search_endpoint(index: dict, query: str):
+    """
+    Simple keyword search over a prebuilt search index
+    """
+    starts = index["starts"]
+    results = index["results"]
+    if not results:
+        return []
+    query = query.lower()
+    # A query containing the separator could match across fields/endpoints
+    if "\0" in query:
+        return []
+    blob = index["blob"]
+    last = len(starts) - 1
+    found = []
+    pos = blob.find(query)
+    while pos != -1:
+        i = bisect_right(starts, pos) - 1
+        found.append(results[i])
+        if i == last:
+            break
+        # One hit per endpoint: resume the scan at the next endpoint
+        pos = blob.find(query, starts[i + 1])
+    return found
\ No newline at end of file
@@ -0,0 +1,107 @@
+import asyncio
+import io
+import itertools
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.datastructures import UploadFile
+
+from backend import main
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    monkeypatch.setattr(main, "API_SPEC", {})
+    monkeypatch.setattr(main, "SEARCH_INDEX", main.build_search_index({}))
+    monkeypatch.setattr(main, "_SPEC_CACHE", {})
+    monkeypatch.setattr(main, "_UPLOAD_SEQ", itertools.count(1))
+    monkeypatch.setattr(main, "_PUBLISHED_SEQ", 0)
+
+
+@pytest.fixture
+def client():
+    return TestClient(main.app)
+
+
+def spec_for(path):
+    return b'{"info": {"title": "T", "version": "1"}, "paths": {"%s": {"get": {"summary": "s"}}}}' % path.encode()
+
+
+def upload(client, content):
+    return client.post("/parse-spec", files={"file": ("spec.json", content)})
+
+
+def search_paths(client, query=""):
+    return [r["path"] for r in client.get("/search", params={"query": query}).json()["results"]]
+
+
+def test_upload_then_search(client):
+    response = upload(client, spec_for("/users"))
+    assert response.status_code == 200
+    assert response.json() == {
+        "message": "Spec uploaded successfully!",
+        "published": True,
+        "title": "T",
+        "version": "1",
+        "path_count": 1,
+    }
+    assert search_paths(client, "USER") == ["/users"]
+
+
+def test_cache_hit_skips_load_spec(client, monkeypatch):
+    upload(client, spec_for("/a"))
+    upload(client, spec_for("/b"))
+
+    def fail(content):
+        raise AssertionError("cached upload was parsed again")
+
+    monkeypatch.setattr(main, "_load_spec", fail)
+    assert upload(client, spec_for("/a")).status_code == 200
+    assert search_paths(client) == ["/a"]
+
+
+def test_cache_evicts_least_recently_uploaded(client):
+    for i in range(main._SPEC_CACHE_SIZE):
+        upload(client, spec_for("/p%d" % i))
+    upload(client, spec_for("/p0"))  # hit: /p0 becomes most recent
+    upload(client, spec_for("/new"))  # evicts /p1, the oldest
+    cached = [next(iter(spec["paths"])) for spec, _, _ in main._SPEC_CACHE.values()]
+    assert cached == ["/p2", "/p3", "/p0", "/new"]
+
+
+def test_older_upload_finishing_last_is_not_published(monkeypatch):
+    entered = threading.Event()
+    release = threading.Event()
+    load_spec = main._load_spec
+
+    def slow_load_spec(content):
+        if b"/slow" in content:
+            entered.set()
+            release.wait(5)
+        return load_spec(content)
+
+    monkeypatch.setattr(main, "_load_spec", slow_load_spec)
+
+    async def run():
+        slow = asyncio.create_task(main.parse_api_spec(UploadFile(io.BytesIO(spec_for("/slow")))))
+        while not entered.is_set():
+            await asyncio.sleep(0.01)
+        fast = await main.parse_api_spec(UploadFile(io.BytesIO(spec_for("/fast"))))
+        release.set()
+        return await slow, fast
+
+    slow, fast = asyncio.run(run())
+    assert fast["published"] is True
+    assert slow["published"] is False
+    assert slow["message"] != fast["message"]
+    assert [r["path"] for r in main.search_endpoint(main.SEARCH_INDEX, "")] == ["/fast"]
+    assert list(main.API_SPEC["paths"]) == ["/fast"]
+
+
+@pytest.mark.parametrize("content", [b"", b"[1, 2]", b"just text", b"foo: [unclosed"])
+def test_invalid_upload_is_rejected_and_keeps_current_spec(client, content):
+    upload(client, spec_for("/kept"))
+    response = upload(client, content)
+    assert response.status_code == 400
+    assert search_paths(client) == ["/kept"]
@@ -0,0 +1,82 @@
+from nlp.nlp_utils import HTTP_METHODS, build_search_index, search_endpoint
+
+SPEC = {
+    "paths": {
+        "/users": {
+            "parameters": [{"name": "limit", "in": "query"}],
+            "get": {"summary": "List users"},
+            "post": {"summary": "Create a user for users"},
+        },
+        "/users/{id}": {
+            "summary": "Single user",
+            "get": {"summary": "Get user by id"},
+            "delete": {},
+        },
+        "/pets": {
+            "get": {"summary": "List pets, pets and more pets"},
+            "x-amazon-apigateway-any-method": {"summary": "Any pets method"},
+        },
+    }
+}
+
+
+def naive_search(spec, query):
+    """Per-endpoint substring search the blob index must agree with"""
+    query = query.lower()
+    results = []
+    for path, methods in spec["paths"].items():
+        for method, details in methods.items():
+            if method not in HTTP_METHODS:
+                continue
+            summary = details.get("summary", "")
+            if query in path.lower() or query in summary.lower():
+                results.append({"path": path, "method": method.upper(), "summary": summary})
+    return results
+
+
+def test_matches_naive_search():
+    index = build_search_index(SPEC)
+    for query in ["", "user", "USERS", "/users/{", "pets", "pet", "id", "list", "nothing"]:
+        assert search_endpoint(index, query) == naive_search(SPEC, query), query
+
+
+def test_empty_query_returns_every_endpoint():
+    assert len(search_endpoint(build_search_index(SPEC), "")) == 5
+
+
+def test_hit_in_last_endpoint():
+    results = search_endpoint(build_search_index(SPEC), "more pets")
+    assert results == [{"path": "/pets", "method": "GET", "summary": "List pets, pets and more pets"}]
+
+
+def test_repeated_hits_in_one_endpoint_are_reported_once():
+    results = search_endpoint(build_search_index(SPEC), "pets")
+    assert [(r["path"], r["method"]) for r in results] == [("/pets", "GET")]
+
+
+def test_query_cannot_match_across_separator():
+    index = build_search_index(SPEC)
+    assert search_endpoint(index, "\0") == []
+    assert search_endpoint(index, "users\0list") == []
+    assert search_endpoint(index, "users\0/users") == []
+
+
+def test_skips_non_operation_entries():
+    spec = {
+        "paths": {
+            200: {"get": {"summary": "numeric path"}},
+            "/a": {
+                200: {"summary": "numeric method"},
+                "servers": [{"url": "http://x"}],
+                "x-ext": {"summary": "extension"},
+                "$ref": "#/x",
+                "GET": {"summary": "upper-case verb"},
+            },
+        }
+    }
+    results = search_endpoint(build_search_index(spec), "")
+    assert results == [{"path": "/a", "method": "GET", "summary": "upper-case verb"}]
+
+
+def test_empty_spec():
+    assert search_endpoint(build_search_index({}), "") == []